@@ -35,6 +35,7 @@ from tomlraider.core import (
     join_path,
     parse_path,
     read_toml,
+    read_toml_file,
 )
 
 
@@ -58,4 +59,5 @@ __all__ = [
     "main",
     "parse_path",
     "read_toml",
+    "read_toml_file",
 ]
@@ -21,11 +21,11 @@
 from __future__ import annotations
 
 import argparse
-import fileinput
+import functools
 import os
 import sys
 from pathlib import Path
-from typing import TYPE_CHECKING, ClassVar
+from typing import TYPE_CHECKING
 
 from deluxe.console import PrettyParser
 
@@ -40,11 +40,12 @@ from tomlraider.core import (
     join_path,
     parse_path,
     read_toml,
+    read_toml_file,
 )
 
 
 if TYPE_CHECKING:
-    from collections.abc import Sequence
+    from collections.abc import Callable, Sequence
 
     from tomlraider.core import TomlAtomicType, TomlContainerType
 
@@ -52,31 +53,39 @@ if TYPE_CHECKING:
 PROG_NAME = "tomlraider"
 
 
-def _message(value: str, quiet: bool) -> None:
-    if quiet:
-        return
+def _message(value: str) -> None:
     sys.stderr.write(f"{PROG_NAME}: {value}\n")
 
 
+def _silent(_value: str) -> None:
+    return
+
+
+# exit codes by exception type, any other error exits with 1
+_ERROR_CODES: dict[type[BaseException], int] = {
+    SystemExit: 0,
+    TOMLDecodeError: 2,
+    UnicodeDecodeError: 2,
+    TOMLPathFormatError: 3,
+    TOMLLookUpError: 4,
+    KeyError: 5,
+    IndexError: 6,
+}
+
+
 class _CLIError(Exception):
-    _error_codes: ClassVar[dict[type[BaseException], int]] = {
-        SystemExit: 0,
-        Exception: 1,
-        TOMLDecodeError: 2,
-        TOMLPathFormatError: 3,
-        TOMLLookUpError: 4,
-        KeyError: 5,
-        IndexError: 6,
-    }
-
-    def __init__(self, msg: str | None, quiet: bool, _from: BaseException | None = None) -> None:
+    def __init__(
+        self, msg: str | None, emit: Callable[[str], None], _from: BaseException | None = None
+    ) -> None:
         self.msg: str = msg or ""
-        self.quiet: bool = quiet
-        self.code: int = self._error_codes.get(type(_from), 1) if _from else 1
+        self.emit: Callable[[str], None] = emit
+        self.code: int = 1 if _from is None else _ERROR_CODES.get(type(_from), 1)
         super().__init__()
 
 
+@functools.cache
 def _get_parser() -> argparse.ArgumentParser:
+    # built once and reused by every main() call
     parser = PrettyParser(
         prog=PROG_NAME,
         version=__version__,
@@ -123,63 +132,133 @@ def _get_parser() -> argparse.ArgumentParser:
     return parser
 
 
-def _parse_argv(
-    parser: argparse.ArgumentParser, argv: Sequence[str] | None = None
-) -> argparse.Namespace:
+@functools.cache
+def _pyproject_path() -> Path:
+    # where to look for a <pyproject.toml> file, resolved once per process,
+    # call _pyproject_path.cache_clear() if the environment changed.
+    meson_root = os.environ.get("MESON_SOURCE_ROOT", None)
+    root: Path = Path(meson_root) if meson_root else Path.cwd()
+    return root / "pyproject.toml"
+
+
+def _find_pyproject() -> Path | None:
+    # the file itself may come and go between two calls
+    pyproject = _pyproject_path()
+    return pyproject if pyproject.exists() else None
+
+
+_FLAGS = {
+    "-j": "json",
+    "--json": "json",
+    "-p": "pyproject",
+    "--pyproject": "pyproject",
+    "-q": "quiet",
+    "--quiet": "quiet",
+}
+
+
+def _scan_argv(argv: Sequence[str]) -> argparse.Namespace | None:
+    # Fast path for the plain command lines built by scripts, anything
+    # else (help, version, completion, abbreviations, errors...) returns
+    # None and is left to the full argparse parser.
+    if "_ARGCOMPLETE" in os.environ:
+        return None
+    params = argparse.Namespace(json=False, pyproject=False, file=None, quiet=False, property=None)
+    args = iter(argv)
+    for arg in args:
+        if dest := _FLAGS.get(arg):
+            setattr(params, dest, True)
+        elif arg in {"-f", "--file"}:
+            params.file = next(args, None)
+            if params.file is None or (params.file.startswith("-") and params.file != "-"):
+                return None
+        elif arg.startswith("--file="):
+            params.file = arg.removeprefix("--file=")
+        elif arg.startswith("-") or params.property is not None:
+            return None
+        else:
+            params.property = arg
+    if params.property is None or (params.pyproject and params.file is not None):
+        return None
+    return params
+
+
+def _parse_argv(argv: Sequence[str] | None = None) -> argparse.Namespace:
+    if argv is None:
+        argv = sys.argv[1:]
     try:
-        params: argparse.Namespace = parser.parse_args(argv)
+        params: argparse.Namespace = _scan_argv(argv) or _get_parser().parse_args(argv)
     except (argparse.ArgumentError, argparse.ArgumentTypeError) as e:
-        raise _CLIError(msg=str(e), quiet=False) from None
+        raise _CLIError(msg=str(e), emit=_message) from None
     except SystemExit as e:
-        raise _CLIError(msg=None, quiet=False, _from=e) from None
+        raise _CLIError(msg=None, emit=_message, _from=e) from None
+
+    # bind the message writer once, instead of testing quiet on each message
+    params.emit = _silent if params.quiet else _message
 
     try:
         params.property_path = parse_path(params.property)
     except TOMLPathFormatError as e:
-        raise _CLIError(e.msg, params.quiet, e) from None
+        raise _CLIError(e.msg, params.emit, e) from None
     params.output = Output.JSON if params.json else Output.SHELL
 
     # Verify input file
     if params.pyproject:
-        # looking for a <pyproject.toml> file
-        meson_root = os.environ.get("MESON_SOURCE_ROOT", None)
-        root: Path = Path(meson_root) if meson_root else Path.cwd()
-        tmp = root / "pyproject.toml"
-        if not tmp.exists():
-            raise _CLIError(msg="<pyproject.toml> file not found", quiet=params.quiet)
-        params.file = str(tmp)
-    elif params.file not in {"-", None} and not Path(str(params.file)).exists():
-        raise _CLIError(msg=f"File not found: {params.file}", quiet=params.quiet)
+        if (pyproject := _find_pyproject()) is None:
+            raise _CLIError(msg="<pyproject.toml> file not found", emit=params.emit)
+        params.file = str(pyproject)
+    file: str | None = params.file
+    if not file or file == "-":
+        params.file_path, params.file_name = None, "stdin"
+    elif (file_path := Path(file)).is_file():
+        params.file_path, params.file_name = file_path, file
+    else:
+        raise _CLIError(msg=f"File not found: {file}", emit=params.emit)
     return params
 
 
-def _read_buffer(params: argparse.Namespace) -> str:
-    # Format sys.argv for fileinput module
-    # FIXME: - main called from python
-    #        - what when argparse exit by itself
-    sys.argv = [sys.argv[0]]
-    if params.file:
-        sys.argv.append(params.file)
+def _read_stdin() -> str:
+    # read the whole input in one chunk and decode it once, unless stdin
+    # was replaced by a text only stream (eg. when called from python).
+    if (buffer := getattr(sys.stdin, "buffer", None)) is None:
+        return sys.stdin.read()
+    return buffer.read().decode("utf-8")
 
-    with fileinput.input(mode="r", encoding="utf-8") as _file:
-        file_name = params.file or "stdin"
-        _message(
-            f"Reading property <{join_path(params.property_path)}> from <{file_name}>...\n",
-            params.quiet,
-        )
-        return "".join(list(_file))
 
+def _write_stdout(value: str) -> None:
+    # encode once and bypass the text layer, unless stdout was
+    # replaced by a text only stream (eg. when called from python).
+    if (buffer := getattr(sys.stdout, "buffer", None)) is None:
+        sys.stdout.write(value)
+        return
+    buffer.write(value.encode("utf-8"))
+    buffer.flush()
 
-def _parse_request(buffer: str, params: argparse.Namespace) -> None:
+
+def _parse_request(params: argparse.Namespace) -> None:
+    if not params.quiet:
+        # don't even format the message in quiet mode
+        params.emit(
+            f"Reading property <{join_path(params.property_path)}> from <{params.file_name}>...\n"
+        )
+    value: TomlAtomicType | TomlContainerType
     try:
-        value: TomlAtomicType | TomlContainerType = read_toml(buffer, params.property_path)
-    except TOMLDecodeError as e:
+        if params.file_path is None:
+            value = read_toml(_read_stdin(), params.property_path, _copy=False)
+        else:
+            # files are read through a cache of the parsed documents,
+            # the value is only dumped so it isn't copied out of it.
+            value = read_toml_file(params.file_path, params.property_path, _copy=False)
+    except (TOMLDecodeError, UnicodeDecodeError) as e:
         msg = f"error decoding <{params.file_name}>, {e}"
-        raise _CLIError(msg, params.quiet, e) from None
+        raise _CLIError(msg, params.emit, e) from None
     except TOMLLookUpError as e:
-        raise _CLIError(e.msg, params.quiet, e) from None
+        raise _CLIError(e.msg, params.emit, e) from None
+    except (KeyError, IndexError) as e:
+        msg = f"property not found: <{join_path(params.property_path)}>"
+        raise _CLIError(msg, params.emit, e) from None
     else:
-        sys.stdout.write(
+        _write_stdout(
             dumps(value=value, output=params.output, path=params.property.strip(PATH_SEPARATOR))
         )
 
@@ -194,13 +273,11 @@ def main(*args: str) -> int:  # noqa: D417
         The exit code of the program.
     """
     try:
-        parser = _get_parser()
-        params = _parse_argv(parser, argv=args or None)
-        buffer = _read_buffer(params)
-        _parse_request(buffer, params)
+        params = _parse_argv(argv=args or None)
+        _parse_request(params)
     except _CLIError as e:
         if e.msg:
-            _message(value=e.msg, quiet=e.quiet)
+            e.emit(e.msg)
         return e.code
     return 0
 
@@ -16,13 +16,23 @@
 
 from __future__ import annotations
 
+import contextlib
+import copy
 import enum
-import json
+import functools
+import importlib
+import operator
 import re
 import tomllib
+from collections import OrderedDict
 from datetime import date, datetime, time
 from tomllib import TOMLDecodeError as _TOMLDecodeError
-from typing import NewType, TypeAlias
+from typing import TYPE_CHECKING, NewType, TypeAlias, cast
+
+
+if TYPE_CHECKING:
+    from collections.abc import Callable, Iterator
+    from pathlib import Path
 
 
 PATH_SEPARATOR = "."
@@ -57,24 +67,37 @@ TomlPathPart: TypeAlias = TomlKey | TomlIndex
 TomlPath: TypeAlias = list[TomlPathPart]
 
 
-class TomlContainer:
-    """Generic Toml container."""
+try:
+    # imported by name, the optional dependency may or may not be
+    # installed where the type checker runs.
+    rtoml = importlib.import_module("rtoml")
+except ImportError:
 
-    __slots__ = ("real",)
+    def _loads(buffer: str) -> dict[str, TomlType]:
+        return tomllib.loads(buffer)
 
-    def __init__(self, container: TomlContainerType) -> None:
-        self.real = container
+else:
+    _rtoml_loads = cast("Callable[[str], dict[str, TomlType]]", rtoml.loads)
+    _TomlParsingError = cast("type[Exception]", rtoml.TomlParsingError)
 
-    def __getitem__(self, key: TomlPathPart) -> TomlAtomicType | TomlContainerType:
-        if isinstance(self.real, list) and isinstance(key, int):
-            return self.real[key]
-        if isinstance(self.real, dict) and isinstance(key, str):
-            return self.real[key]
+    def _loads(buffer: str) -> dict[str, TomlType]:
+        # rtoml is a native parser, much faster than the pure python tomllib,
+        # but we keep raising tomllib's error type to not break the API.
+        try:
+            return _rtoml_loads(buffer)
+        except _TomlParsingError as e:
+            raise TOMLDecodeError(str(e)) from None
+
+
+# Parsed documents LRU cache for read_toml_file(), keyed by file path
+# and holding the (st_mtime_ns, st_size) fingerprint of the parsed file.
+_PARSE_CACHE_SIZE = 32
+_parse_cache: OrderedDict[str, tuple[tuple[int, int], dict[str, TomlType]]] = OrderedDict()
 
-        _t = "array" if isinstance(self.real, list) else "table"
-        _i = "TomlKey" if isinstance(key, str) else "TomlIndex"
-        msg = f"trying to access a Toml's {_t} with a {_i}"
-        raise TOMLLookUpError(msg)
+
+@functools.lru_cache(maxsize=32)
+def _loads_cached(buffer: str) -> dict[str, TomlType]:
+    return _loads(buffer)
 
 
 @enum.unique
@@ -91,7 +114,51 @@ class Output(enum.Enum):
     JSON = enum.auto()
 
 
-def read_toml(buffer: str, path: TomlPath) -> TomlAtomicType | TomlContainerType:
+def _walk(root: dict[str, TomlType], path: TomlPath) -> TomlAtomicType | TomlContainerType:
+    if path and type(path[0]) is int:
+        msg = "trying to address the Toml's global table with an index"
+        raise TOMLLookUpError(msg)
+
+    # parsed documents only hold exact dict and list containers,
+    # a type identity check is cheaper than an isinstance() call.
+    node: TomlAtomicType | TomlContainerType = root
+    for part in path:
+        node_type, part_type = type(node), type(part)
+        # let dict and list raise KeyError and IndexError by themselves
+        if (node_type is dict and part_type is str) or (node_type is list and part_type is int):
+            node = cast("TomlType", node[part])  # pyright: ignore[reportArgumentType]
+        elif node_type is dict or node_type is list:
+            _t = "array" if node_type is list else "table"
+            _i = "TomlKey" if part_type is str else "TomlIndex"
+            msg = f"trying to access a Toml's {_t} with a {_i}"
+            raise TOMLLookUpError(msg)
+        else:
+            # any atomic value are only valid for the last part of a path
+            msg = f"trying to address an atomic Toml value, {node_type} is not subscriptable"
+            raise TOMLLookUpError(msg)
+    return node
+
+
+# operator.getitem typed for a path traversal
+_getitem = cast("Callable[[TomlType, TomlPathPart], TomlType]", operator.getitem)
+
+
+def _lookup(root: dict[str, TomlType], path: TomlPath) -> TomlAtomicType | TomlContainerType:
+    # Fast path, the whole traversal runs in C. On failure, the checked walk
+    # is run again to raise the right error. Indexing a string by an int
+    # silently succeeds in python, such one-char results are walked again.
+    try:
+        node: TomlType = functools.reduce(_getitem, path, root)
+    except (LookupError, TypeError):
+        return _walk(root, path)
+    if type(node) is str and len(node) == 1 and type(path[-1]) is int:
+        return _walk(root, path)
+    return node
+
+
+def read_toml(
+    buffer: str, path: TomlPath, *, _copy: bool = True
+) -> TomlAtomicType | TomlContainerType:
     r"""Returns property from a toml string buffer.
 
     Args:
@@ -103,6 +170,12 @@ def read_toml(buffer: str, path: TomlPath) -> TomlAtomicType | TomlContainerType
 
     Raises:
         TOMLLookUpError: If there is an error in the TOML lookup.
+        KeyError: If a key of the path is missing.
+        IndexError: If an index of the path is out of range.
+
+    Note:
+        The buffer is parsed with `rtoml` when it is installed
+        (`tomlraider[fast]`), falling back to the standard `tomllib`.
 
     Examples:
         >>> buffer = [section]\nkey = "value"
@@ -110,52 +183,115 @@ def read_toml(buffer: str, path: TomlPath) -> TomlAtomicType | TomlContainerType
         >>> read_toml(buffer, path)
         value
     """
-    root = tomllib.loads(buffer)
-    locations: list[TomlContainer] = [TomlContainer(root)]
+    value = _lookup(_loads_cached(buffer), path)
+    # callers that never mutate the value (the cli) skip the copy
+    return copy.deepcopy(value) if _copy else value
 
-    if not path:
-        return root
 
-    if isinstance(path[0], int):
-        msg = "trying to address the Toml's global table with an index"
-        raise TOMLLookUpError(msg)
+def read_toml_file(
+    file: Path, path: TomlPath, *, _copy: bool = True
+) -> TomlAtomicType | TomlContainerType:
+    """Returns property from a toml file.
 
-    for part in path[:-1]:
-        loc: TomlContainer = locations[-1]
-        if isinstance(loc[part], (dict, list)):
-            locations.append(
-                TomlContainer(loc[part]),  # pyright: ignore[reportArgumentType]
-            )
-            continue
+    The parsed document is cached and only parsed again
+    if the modification time or the size of the file changed.
 
-        # any atomic value are only valid for the last part of a path
-        msg = f"trying to address an atomic Toml value, {type(loc[part])} is not subscriptable"
-        raise TOMLLookUpError(msg)
+    Args:
+        file (Path): The TOML file to read.
+        path (TomlPath): The path to the property.
 
-    return locations[-1][path[-1]]
+    Returns:
+        Union[TomlAtomicType, TomlContainerType]: The property value.
+
+    Raises:
+        TOMLLookUpError: If there is an error in the TOML lookup.
+        KeyError: If a key of the path is missing.
+        IndexError: If an index of the path is out of range.
+    """
+    stat = file.stat()
+    fingerprint = (stat.st_mtime_ns, stat.st_size)
+    key = str(file.absolute())
+    cached = _parse_cache.get(key)
+    if cached is not None and cached[0] == fingerprint:
+        root = cached[1]
+    else:
+        root = _loads(file.read_bytes().decode("utf-8"))
+        _parse_cache[key] = (fingerprint, root)
+        if len(_parse_cache) > _PARSE_CACHE_SIZE:
+            _ = _parse_cache.popitem(last=False)
+    _parse_cache.move_to_end(key)
+    value = _lookup(root, path)
+    return copy.deepcopy(value) if _copy else value
+
+
+_BARE_KEY_RE: re.Pattern[str] = re.compile(r"\A[A-Za-z0-9_-]+\Z")
+# bare, basic or literal string key as defined by the TOML specification
+_KEY_RE: re.Pattern[str] = re.compile(
+    r"""\A(?:
+        [A-Za-z0-9_-]+
+        |"(?:[^"\\\x00-\x08\x0a-\x1f\x7f]|\\[btnfr"\\]|\\u[0-9A-Fa-f]{4}|\\U[0-9A-Fa-f]{8})*"
+        |'[^'\x00-\x08\x0a-\x1f\x7f]*'
+    )\Z""",
+    re.VERBOSE,
+)
 
 
 def _validate_key(key: str) -> bool:
-    try:
-        tomllib.loads(f"{key}='test'")
-    except TOMLDecodeError:
-        return False
-    else:
-        return True
+    return _KEY_RE.match(key) is not None
+
+
+def _decode_key(key: str) -> str:
+    if not _validate_key(key):
+        msg = f"Invalid key in TomlPath: {key}"
+        raise TOMLPathFormatError(msg)
+    if key[0] == '"' and "\\" in key:
+        # escape sequences in basic strings are decoded by tomllib
+        try:
+            return next(iter(tomllib.loads(f"{key}=0")))
+        except TOMLDecodeError:
+            msg = f"Invalid key in TomlPath: {key}"
+            raise TOMLPathFormatError(msg) from None
+    return key[1:-1] if key[0] in "\"'" else key
 
 
-# TODO: include slice pattern
-def _look_for_key_indice(key: str) -> tuple[str, str] | None:
-    regex: re.Pattern[str] = re.compile(r"^(.+)\[(-?\d*)\]$")
-    if match := regex.match(key):
-        _key, _index = match.groups()
-        return (_key, _index) if _validate_key(_key) else None
-    return None
+# One path segment, a key with its indices, each quoted key is
+# fully checked afterward by _decode_key(). Segments are separated
+# by any number of separators, and leading or trailing ones are allowed.
+_SEGMENT_RE: re.Pattern[str] = re.compile(
+    r"""\.*
+    (?P<key>[A-Za-z0-9_-]+|"(?:[^"\\]|\\.)*"|'[^']*')
+    (?P<indices>(?:\[-?[0-9]+\])*)  # TODO: include slice pattern
+    (?:\.+|\Z)""",
+    re.VERBOSE,
+)
+
+_INDEX_RE: re.Pattern[str] = re.compile(r"-?[0-9]+")
+
+
+def _tokenize_path(path: str) -> Iterator[str | int]:
+    # yields plain str and int, TomlKey and TomlIndex are no-ops at runtime
+    pos, end = 0, len(path)
+    while pos < end:
+        if not (match := _SEGMENT_RE.match(path, pos)):
+            if not (rest := path[pos:].strip(PATH_SEPARATOR)):
+                return  # only separators left
+            msg = f"Invalid key in TomlPath: {rest}"
+            raise TOMLPathFormatError(msg)
+        yield _decode_key(match["key"])
+        if indices := match["indices"]:
+            yield from map(int, _INDEX_RE.findall(indices))
+        pos = match.end()
+
+
+_SIMPLE_PATH_RE: re.Pattern[str] = re.compile(r"\A[A-Za-z0-9_-]+(?:\.[A-Za-z0-9_-]+)*\Z")
 
 
 def parse_path(path: str) -> TomlPath:
     """Parses a string into a TomlPath.
 
+    Quoted keys may contain separators and are unquoted,
+    several indices may follow a key to address nested arrays.
+
     Args:
         path (str): The string representing the TOML path.
 
@@ -170,18 +306,19 @@ def parse_path(path: str) -> TomlPath:
         >>> parse_path(path)
         [TomlKey('section'), TomlKey('key'), TomlIndex(0)]
     """
-    out: TomlPath = []
-    for part in path.split(PATH_SEPARATOR):
-        if not part:
-            continue
-        if _validate_key(part):
-            out.append(TomlKey(part))
-        elif search := _look_for_key_indice(part):
-            out.extend((TomlKey(search[0]), TomlIndex(int(search[1]))))
-        else:
-            msg = f"Invalid key in TomlPath: {part}"
-            raise TOMLPathFormatError(msg) from None
-    return out
+    # fast path for the common dotted path of bare keys, stripping the
+    # outer separators first so the split yields no empty parts.
+    if _SIMPLE_PATH_RE.match(stripped := path.strip(PATH_SEPARATOR)):
+        return cast("TomlPath", stripped.split(PATH_SEPARATOR))
+    return cast("TomlPath", list(_tokenize_path(path)))
+
+
+def _format_key(key: str) -> str:
+    if _BARE_KEY_RE.match(key):
+        return key
+    import json  # noqa: PLC0415
+
+    return json.dumps(key, ensure_ascii=False)
 
 
 def join_path(path: TomlPath) -> str:
@@ -196,18 +333,105 @@ def join_path(path: TomlPath) -> str:
     Examples:
         >>> path = [TomlKey('section'), TomlKey('key'), TomlIndex(0)]
         >>> join_path(path)
-        section.key[0]
+        .section.key[0]
     """
-    # Function implementation
+    return "".join(
+        f"[{part}]" if isinstance(part, int) else f"{PATH_SEPARATOR}{_format_key(part)}"
+        for part in path
+    )
+
+
+@functools.cache
+def _orjson_dumps() -> Callable[[TomlType], bytes] | None:
+    # orjson is optional and only imported on the first json output
+    try:
+        orjson = importlib.import_module("orjson")
+    except ImportError:
+        return None
+    return cast("Callable[[TomlType], bytes]", orjson.dumps)
+
+
+def _has_float(value: TomlType) -> bool:
+    # orjson and json only disagree on floats, orjson writes exponents
+    # without sign or padding and non-finite values as null. Parsed
+    # documents only hold exact types, see _walk().
+    value_type = type(value)
+    if value_type is float:
+        return True
+    if value_type is dict:
+        return any(map(_has_float, cast("dict[str, TomlType]", value).values()))
+    if value_type is list:
+        return any(map(_has_float, cast("list[TomlType]", value)))
+    return False
+
+
+def _isoformat(value: object) -> str:
+    if isinstance(value, (date, time)):
+        return value.isoformat()
+    msg = f"Object of type {type(value).__name__} is not JSON serializable"
+    raise TypeError(msg)
 
-    out: list[str] = []
-    for part in path:
-        match part:
-            case str():
-                out.extend((PATH_SEPARATOR, part))
-            case int():
-                out.append(f"[{part}]")
-    return "".join(out)
+
+def _json_dumps(value: TomlType) -> str:
+    # orjson is much faster and serializes datetime, date and time natively,
+    # values holding a float are left to json to get the same output.
+    if (orjson_dumps := _orjson_dumps()) is not None and not _has_float(value):
+        with contextlib.suppress(TypeError):  # integers above 64 bits
+            return orjson_dumps(value).decode("utf-8")
+
+    # only imported when needed, json isn't used by shell output
+    import json  # noqa: PLC0415
+
+    # TOML inf and nan have no JSON equivalent, they are explicitly
+    # written as Infinity and NaN, as javascript does.
+    return json.dumps(
+        value, default=_isoformat, allow_nan=True, ensure_ascii=False, separators=(",", ":")
+    )
+
+
+def _dump_scalar(value: TomlType, _path: str) -> str:
+    return str(value)
+
+
+def _dump_bool(value: TomlType, _path: str) -> str:
+    return "1" if value else "0"
+
+
+def _dump_list(value: TomlType, _path: str) -> str:
+    # arrays of strings are the common case, joined without any conversion
+    items = cast("list[TomlType]", value)
+    if items and type(items[0]) is str:
+        with contextlib.suppress(TypeError):  # mixed-type array
+            return SHELL_LIST_SEPARATOR.join(cast("list[str]", items))
+    return SHELL_LIST_SEPARATOR.join(map(str, items))
+
+
+def _dump_table(_value: TomlType, path: str) -> str:
+    # tables are not printed, only their own path
+    return f"{PATH_SEPARATOR}{path}"
+
+
+_DUMPERS: dict[type, Callable[[TomlType, str], str]] = {
+    bool: _dump_bool,
+    str: _dump_scalar,
+    int: _dump_scalar,
+    float: _dump_scalar,
+    datetime: _dump_scalar,
+    date: _dump_scalar,
+    time: _dump_scalar,
+    list: _dump_list,
+    dict: _dump_table,
+}
+
+
+def _find_dumper(value_type: type) -> Callable[[TomlType, str], str]:
+    # subclasses of the TOML types, fall back on their nearest base
+    for base in value_type.__mro__[1:]:
+        if dumper := _DUMPERS.get(base):
+            return dumper
+    # should never happened
+    msg = f"Unsupported type: {value_type}"
+    raise NotImplementedError(msg)
 
 
 def dumps(value: TomlType, output: Output, path: str) -> str:
@@ -225,23 +449,13 @@ def dumps(value: TomlType, output: Output, path: str) -> str:
         NotImplementedError: If the value has an unsupported type.
     """
     if output is Output.JSON:
-        return json.dumps(value)
-
-    match value:
-        case bool():
-            ret = "1" if value else "0"
-        case str() | int() | float():
-            ret = str(value)
-        case datetime():
-            ret = str(value)
-        case time():
-            ret = str(value)
-        case list():
-            ret = SHELL_LIST_SEPARATOR.join(map(str, value))
-        case dict():
-            ret = f"{PATH_SEPARATOR}{path}"
-        case _:
-            # should never happened
-            msg = f"Unsupported type: {type(value)}"
-            raise NotImplementedError(msg)
-    return ret
+        return _json_dumps(value)
+
+    # most properties are strings, returned without any dispatch
+    value_type = type(value)
+    if value_type is str:
+        return value  # pyright: ignore[reportReturnType]
+
+    # exact type lookup, bool values won't be dispatched as int
+    dumper = _DUMPERS.get(value_type) or _find_dumper(value_type)
+    return dumper(value, path)
@@ -0,0 +1,164 @@
+# Copyright (c) 2024 - Gilles Coissac
+#
+# tomlraider is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# tomlraider is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with tomlraider. If not, see <https://www.gnu.org/licenses/>
+from __future__ import annotations
+
+import io
+import sys
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tomlraider.cli import _get_parser, _pyproject_path, _scan_argv, main
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+BUFFER = """
+[project]
+name = "tomlraider"
+keywords = ["toml", "cli"]
+"""
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        ["project.name"],
+        ["-j", "project.name"],
+        ["project.name", "-q", "--json"],
+        ["-f", "pyproject.toml", "project.name"],
+        ["--file=pyproject.toml", "project.name"],
+        ["-f", "-", "project.name"],
+        ["--quiet", "--pyproject", ".project.keywords[0]"],
+    ],
+)
+def test_scan_argv(argv: list[str]):
+    assert _scan_argv(argv) == _get_parser().parse_args(argv)
+
+
+@pytest.mark.parametrize(
+    "argv",
+    [
+        [],
+        ["-h"],
+        ["-v"],
+        ["-jq", "project.name"],
+        ["--js", "project.name"],
+        ["-f"],
+        ["-f", "-q", "project.name"],
+        ["-p", "-f", "pyproject.toml", "project.name"],
+        ["project.name", "project.version"],
+    ],
+)
+def test_scan_argv_fallback(argv: list[str]):
+    assert _scan_argv(argv) is None
+
+
+def test_main_text_stdin(monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str]):
+    monkeypatch.setattr(sys, "stdin", io.StringIO('[project]\nname = "x"\n'))
+    assert main("-q", "project.name") == 0
+    assert capsys.readouterr().out == "x"
+
+
+def test_main_pyproject_removed(
+    monkeypatch: pytest.MonkeyPatch, tmp_path: Path, capsys: pytest.CaptureFixture[str]
+):
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.delenv("MESON_SOURCE_ROOT", raising=False)
+    _pyproject_path.cache_clear()
+    pyproject = tmp_path / "pyproject.toml"
+    pyproject.write_text('[project]\nname = "x"\n', encoding="utf-8")
+    assert main("-q", "-p", "project.name") == 0
+    assert capsys.readouterr().out == "x"
+
+    pyproject.unlink()
+    assert main("-p", "project.name") == 1
+    assert "<pyproject.toml> file not found" in capsys.readouterr().err
+    _pyproject_path.cache_clear()
+
+
+@pytest.mark.parametrize(
+    ("args", "code", "out"),
+    [
+        (["project.name"], 0, "tomlraider"),
+        (["project.keywords"], 0, "toml cli"),
+        (["-j", "project.keywords"], 0, '["toml","cli"]'),
+        (["project"], 0, ".project"),
+        (["project.name[0]"], 4, ""),
+        (["project.missing"], 5, ""),
+        (["project.keywords[2]"], 6, ""),
+        (["project name"], 3, ""),
+    ],
+)
+def test_main_file(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], args: list[str], code: int, out: str
+):
+    file = tmp_path / "test.toml"
+    file.write_text(BUFFER, encoding="utf-8")
+    assert main("-q", "-f", str(file), *args) == code
+    captured = capsys.readouterr()
+    assert (captured.out, captured.err) == (out, "")
+
+
+@pytest.mark.parametrize(
+    ("content", "code"),
+    [
+        (b"[project\n", 2),
+        (b"name = '\xff'\n", 2),
+    ],
+)
+def test_main_decode_error(
+    tmp_path: Path, capsys: pytest.CaptureFixture[str], content: bytes, code: int
+):
+    file = tmp_path / "test.toml"
+    file.write_bytes(content)
+    assert main("-f", str(file), "name") == code
+    captured = capsys.readouterr()
+    assert not captured.out
+    assert f"error decoding <{file}>" in captured.err
+
+
+def test_main_missing_property(tmp_path: Path, capsys: pytest.CaptureFixture[str]):
+    file = tmp_path / "test.toml"
+    file.write_text(BUFFER, encoding="utf-8")
+    assert main("-f", str(file), "project.missing") == 5
+    assert "property not found: <.project.missing>" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("name", ["missing.toml", "directory"])
+def test_main_file_not_found(tmp_path: Path, capsys: pytest.CaptureFixture[str], name: str):
+    (tmp_path / "directory").mkdir()
+    assert main("-f", str(tmp_path / name), "project.name") == 1
+    assert "File not found" in capsys.readouterr().err
+
+
+@pytest.mark.parametrize("args", [["-f", ""], ["--file="]])
+def test_main_empty_file_reads_stdin(
+    monkeypatch: pytest.MonkeyPatch, capsys: pytest.CaptureFixture[str], args: list[str]
+):
+    monkeypatch.setattr(sys, "stdin", io.StringIO(BUFFER))
+    assert main("-q", *args, "project.name") == 0
+    assert capsys.readouterr().out == "tomlraider"
+
+
+def test_main_stdin_bytes(
+    monkeypatch: pytest.MonkeyPatch, capsysbinary: pytest.CaptureFixture[bytes]
+):
+    stdin = io.TextIOWrapper(io.BytesIO('[project]\nname = "é"\n'.encode()), encoding="utf-8")
+    monkeypatch.setattr(sys, "stdin", stdin)
+    assert main("-q", "-f", "-", "project.name") == 0
+    assert capsysbinary.readouterr().out == "é".encode()
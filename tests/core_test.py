@@ -0,0 +1,173 @@
+# Copyright (c) 2024 - Gilles Coissac
+#
+# tomlraider is free software: you can redistribute it and/or modify
+# it under the terms of the GNU General Public License as published
+# by the Free Software Foundation, either version 3 of the License,
+# or (at your option) any later version.
+#
+# tomlraider is distributed in the hope that it will be useful,
+# but WITHOUT ANY WARRANTY; without even the implied warranty
+# of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE.
+# See the GNU General Public License for more details.
+#
+# You should have received a copy of the GNU General Public License
+# along with tomlraider. If not, see <https://www.gnu.org/licenses/>
+from __future__ import annotations
+
+from datetime import date, datetime, time
+from typing import TYPE_CHECKING
+
+import pytest
+
+from tomlraider import (
+    Output,
+    TOMLLookUpError,
+    TOMLPathFormatError,
+    core,
+    join_path,
+    parse_path,
+    read_toml,
+    read_toml_file,
+)
+from tomlraider.core import dumps
+
+
+if TYPE_CHECKING:
+    from pathlib import Path
+
+
+BUFFER = """
+[project]
+name = "tomlraider"
+keywords = ["toml", "cli"]
+"""
+
+
+@pytest.mark.parametrize(
+    ("path", "expected"),
+    [
+        ("project.name", ["project", "name"]),
+        (".project.name.", ["project", "name"]),
+        ("tool.ruff-lint.rules_2", ["tool", "ruff-lint", "rules_2"]),
+        ("project.keywords[-1]", ["project", "keywords", -1]),
+        ("'a b'.c", ["a b", "c"]),
+        ('"a.b".c', ["a.b", "c"]),
+        ('"a\\"b"', ['a"b']),
+        ("matrix[0][-1]", ["matrix", 0, -1]),
+    ],
+)
+def test_parse_path(path: str, expected: list[str | int]):
+    assert parse_path(path) == expected
+
+
+@pytest.mark.parametrize(
+    "path", ["a b", "a.b[]", "a.b[x]", "a.[0]", "a[0]b", '"a\\q"', '"a.b', "a.b c"]
+)
+def test_parse_path_invalid(path: str):
+    with pytest.raises(TOMLPathFormatError):
+        parse_path(path)
+
+
+@pytest.mark.parametrize("path", ["section.key[0]", 'a."b.c"[1][2]', "'a b'.c"])
+def test_join_path(path: str):
+    assert parse_path(join_path(parse_path(path))) == parse_path(path)
+
+
+def test_read_toml():
+    assert read_toml(BUFFER, parse_path("project.name")) == "tomlraider"
+    assert read_toml(BUFFER, parse_path("project.keywords[1]")) == "cli"
+
+
+@pytest.mark.parametrize(
+    ("path", "error"),
+    [
+        ("project.missing", KeyError),
+        ("project.keywords[2]", IndexError),
+        ("project.name[0]", TOMLLookUpError),
+        ("project[0]", TOMLLookUpError),
+        ("project.keywords.toml", TOMLLookUpError),
+    ],
+)
+def test_read_toml_lookup_errors(path: str, error: type[Exception]):
+    with pytest.raises(error):
+        read_toml(BUFFER, parse_path(path))
+
+
+def test_read_toml_returns_copy():
+    value = read_toml(BUFFER, parse_path("project.keywords"))
+    value.append("mutated")
+    assert read_toml(BUFFER, parse_path("project.keywords")) == ["toml", "cli"]
+
+
+def test_read_toml_without_copy():
+    path = parse_path("project.keywords")
+    assert read_toml(BUFFER, path, _copy=False) is read_toml(BUFFER, path, _copy=False)
+
+
+def test_read_toml_file_cache(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    parsed: list[str] = []
+
+    def _loads(buffer: str):
+        parsed.append(buffer)
+        return loads(buffer)
+
+    loads = core._loads
+    monkeypatch.setattr(core, "_loads", _loads)
+    file = tmp_path / "pyproject.toml"
+    file.write_text(BUFFER, encoding="utf-8")
+    assert read_toml_file(file, parse_path("project.name")) == "tomlraider"
+    assert read_toml_file(file, parse_path("project.keywords[0]")) == "toml"
+    assert len(parsed) == 1
+
+    file.write_text(BUFFER.replace("tomlraider", "raider"), encoding="utf-8")
+    assert read_toml_file(file, parse_path("project.name")) == "raider"
+    assert len(parsed) == 2
+
+
+def test_read_toml_file_cache_size(monkeypatch: pytest.MonkeyPatch, tmp_path: Path):
+    monkeypatch.setattr(core, "_PARSE_CACHE_SIZE", 2)
+    core._parse_cache.clear()
+    for name in ("a", "b", "c"):
+        file = tmp_path / f"{name}.toml"
+        file.write_text(BUFFER, encoding="utf-8")
+        assert read_toml_file(file, parse_path("project.name")) == "tomlraider"
+    assert list(core._parse_cache) == [str(tmp_path / "b.toml"), str(tmp_path / "c.toml")]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (True, "1"),
+        (False, "0"),
+        ("value", "value"),
+        (42, "42"),
+        (1.5, "1.5"),
+        (date(2024, 1, 2), "2024-01-02"),
+        (datetime(2024, 1, 2, 3, 4), "2024-01-02 03:04:00"),  # noqa: DTZ001
+        (time(3, 4), "03:04:00"),
+        (["a", "b"], "a b"),
+        ({"key": "value"}, ".table"),
+    ],
+)
+def test_dumps_shell(value, expected: str):
+    assert dumps(value, Output.SHELL, "table") == expected
+
+
+@pytest.mark.parametrize("backend", ["orjson", "json"])
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        ({"a": [1, "x", True, date(2024, 1, 2)]}, '{"a":[1,"x",true,"2024-01-02"]}'),
+        ({"t": time(3, 4), "version": "1.2.3"}, '{"t":"03:04:00","version":"1.2.3"}'),
+        ("é", '"é"'),
+        ([1.5, 1e16, 5e-05], "[1.5,1e+16,5e-05]"),
+        ([float("inf"), float("-inf"), float("nan")], "[Infinity,-Infinity,NaN]"),
+        ([2**64, -(2**70)], "[18446744073709551616,-1180591620717411303424]"),
+    ],
+)
+def test_dumps_json(monkeypatch: pytest.MonkeyPatch, backend: str, value, expected: str):
+    if backend == "orjson":
+        pytest.importorskip("orjson")
+    else:
+        monkeypatch.setattr(core, "_orjson_dumps", lambda: None)
+    assert dumps(value, Output.JSON, "") == expected